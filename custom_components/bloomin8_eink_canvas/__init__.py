@@ -1,6 +1,8 @@
 """The BLOOMIN8 E-Ink Canvas integration."""
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 import logging
 import voluptuous as vol
@@ -27,7 +29,26 @@ class RuntimeData:
 
     api_client: EinkCanvasApiClient
     device_info: dict[str, Any] | None = None
-    logs: list[dict[str, Any]] = field(default_factory=list)
+    # Keep only the latest 50 logs; deque drops the oldest entry in O(1)
+    logs: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=50))
+    # Latest 10 logs pre-formatted for the log sensor, so it never re-formats them
+    recent_logs: deque[str] = field(default_factory=lambda: deque(maxlen=10))
+    # Dedicated worker for Pillow processing, kept off Home Assistant's shared executor
+    image_executor: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bloomin8_image"
+        )
+    )
+
+    def add_log(self, message: str, level: str = "info") -> None:
+        """Add log entry."""
+        timestamp = datetime.now()
+        self.logs.append({
+            "timestamp": timestamp,
+            "level": level,
+            "message": message,
+        })
+        self.recent_logs.append(f"[{timestamp:%H:%M:%S}] {level.upper()}: {message}")
 
 
 # Extend ConfigEntry to type hint runtime_data
@@ -84,18 +105,7 @@ async def _register_services(hass: HomeAssistant, entry: EinkCanvasConfigEntry)
     runtime_data = entry.runtime_data
     api_client = runtime_data.api_client
 
-    def add_log(message: str, level: str = "info") -> None:
-        """Add log entry (synchronous)."""
-        log_entry = {
-            "timestamp": datetime.now(),
-            "level": level,
-            "message": message,
-        }
-
-        runtime_data.logs.append(log_entry)
-        # Keep only the latest 50 logs
-        if len(runtime_data.logs) > 50:
-            runtime_data.logs.pop(0)
+    add_log = runtime_data.add_log
 
     async def handle_show_next(call: ServiceCall) -> None:
         """Handle show next image service."""
@@ -156,6 +166,9 @@ async def _register_services(hass: HomeAssistant, entry: EinkCanvasConfigEntry)
 
         success = await api_client.update_settings(settings_data)
         if success:
+            # Reflect the new settings locally so entities update without another device read
+            if runtime_data.device_info is not None:
+                runtime_data.device_info = {**runtime_data.device_info, **settings_data}
             settings_str = ", ".join([f"{k}: {v}" for k, v in settings_data.items()])
             add_log(f"Device settings updated: {settings_str}")
         else:
@@ -163,6 +176,7 @@ async def _register_services(hass: HomeAssistant, entry: EinkCanvasConfigEntry)
 
     async def handle_refresh_device_info(call: ServiceCall) -> None:
         """Handle refresh device info service."""
+        api_client.invalidate_cache()
         device_info = await api_client.get_device_info()
         if device_info:
             runtime_data.device_info = device_info
@@ -200,6 +214,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: EinkCanvasConfigEntry)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        entry.runtime_data.image_executor.shutdown(wait=False)
+
         # Remove services
         services_to_remove = [
             "show_next", "sleep", "reboot", "clear_screen",
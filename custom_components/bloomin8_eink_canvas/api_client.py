@@ -7,8 +7,10 @@ instead of application/json), so we handle JSON parsing manually where needed.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 import json
 import logging
+import time
 from typing import Any
 
 import aiohttp
@@ -28,6 +30,9 @@ from .const import (
     ENDPOINT_DEVICE_INFO,
     ENDPOINT_UPLOAD,
     ENDPOINT_STATUS,
+    ENDPOINT_GALLERY_LIST,
+    ENDPOINT_GALLERY,
+    API_CACHE_TTL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,12 +46,42 @@ class EinkCanvasApiClient:
         self._hass = hass
         self._host = host
         self._session = async_get_clientsession(hass)
+        # Short-lived read cache: key -> (expiry, task); pending tasks coalesce concurrent reads
+        self._cache: dict[str, tuple[float, asyncio.Future]] = {}
 
     @property
     def host(self) -> str:
         """Return the device host."""
         return self._host
 
+    def invalidate_cache(self) -> None:
+        """Drop cached read results so the next read hits the device."""
+        self._cache.clear()
+
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a recent result for key, sharing one in-flight request between callers.
+
+        Fetchers return None on failure; failed reads are not kept.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires, task = entry
+            if not task.done() or expires > time.monotonic():
+                return await asyncio.shield(task)
+
+        task = self._hass.async_create_task(fetch())
+        self._cache[key] = (time.monotonic() + API_CACHE_TTL, task)
+        # Evict from the task itself, so a cancelled caller cannot leave a failure cached
+        task.add_done_callback(lambda done: self._drop_if_failed(key, done))
+        return await asyncio.shield(task)
+
+    def _drop_if_failed(self, key: str, task: asyncio.Future) -> None:
+        """Remove a cache entry whose read was cancelled, raised or returned None."""
+        failed = task.cancelled() or task.exception() is not None or task.result() is None
+        entry = self._cache.get(key)
+        if failed and entry is not None and entry[1] is task:
+            del self._cache[key]
+
     async def get_status(self) -> dict[str, Any] | None:
         """Get device status."""
         try:
@@ -66,7 +101,12 @@ class EinkCanvasApiClient:
 
         Returns device status including name, version, battery, screen resolution,
         current image, network info, etc. See openapi.yaml for full response schema.
+        Results are cached for API_CACHE_TTL seconds.
         """
+        return await self._cached(ENDPOINT_DEVICE_INFO, self._fetch_device_info)
+
+    async def _fetch_device_info(self) -> dict[str, Any] | None:
+        """Fetch device information from the device, bypassing the cache."""
         try:
             async with async_timeout.timeout(10):
                 async with self._session.get(
@@ -98,6 +138,7 @@ class EinkCanvasApiClient:
                 ) as response:
                     if response.status == 200:
                         _LOGGER.info("Successfully sent showNext command")
+                        self.invalidate_cache()
                         return True
                     _LOGGER.error("ShowNext failed with status %s", response.status)
                     return False
@@ -146,6 +187,7 @@ class EinkCanvasApiClient:
                 ) as response:
                     if response.status == 200:
                         _LOGGER.info("Screen cleared successfully")
+                        self.invalidate_cache()
                         return True
                     _LOGGER.error("Clear screen failed with status %s", response.status)
                     return False
@@ -184,6 +226,7 @@ class EinkCanvasApiClient:
                 ) as response:
                     if response.status == 200:
                         _LOGGER.info("Settings updated successfully: %s", settings)
+                        self.invalidate_cache()
                         return True
                     _LOGGER.error("Settings update failed with status %s", response.status)
                     return False
@@ -216,7 +259,7 @@ class EinkCanvasApiClient:
             else:
                 # Fallback for unexpected format
                 gallery = "default"
-                filename = image_path.split("/")[-1]
+                filename = image_path.rpartition("/")[2]
 
             return await self.show_image_by_name(filename, gallery, play_type, dither, duration)
         except Exception as err:
@@ -268,6 +311,7 @@ class EinkCanvasApiClient:
             ) as response:
                 if response.status == 200:
                     _LOGGER.info("Successfully displayed image: %s/%s", gallery, filename)
+                    self.invalidate_cache()
                     return True
                 response_text = await response.text()
                 _LOGGER.error(
@@ -323,6 +367,7 @@ class EinkCanvasApiClient:
                         data=form
                     ) as response:
                         if response.status == 200:
+                            self.invalidate_cache()
                             response_text = await response.text()
 
                             try:
@@ -372,10 +417,16 @@ class EinkCanvasApiClient:
 
         Note:
             Device returns content-type text/json instead of application/json.
+            Results are cached for API_CACHE_TTL seconds.
         """
+        galleries = await self._cached(ENDPOINT_GALLERY_LIST, self._fetch_galleries)
+        return galleries if galleries is not None else []
+
+    async def _fetch_galleries(self) -> list[dict[str, Any]] | None:
+        """Fetch the gallery list from the device, bypassing the cache; None on failure."""
         try:
             async with self._session.get(
-                f"http://{self._host}/gallery/list"
+                f"http://{self._host}{ENDPOINT_GALLERY_LIST}"
             ) as response:
                 if response.status == 200:
                     text_response = await response.text()
@@ -383,10 +434,10 @@ class EinkCanvasApiClient:
                         return json.loads(text_response)
                     except json.JSONDecodeError as err:
                         _LOGGER.error("Failed to parse galleries response: %s", err)
-                return []
+                return None
         except Exception as err:
             _LOGGER.error("Error getting galleries: %s", err)
-            return []
+            return None
 
     async def get_gallery_images(
         self,
@@ -404,7 +455,21 @@ class EinkCanvasApiClient:
         Returns:
             Dict with 'data' (list of images), 'total', 'offset', 'limit'
             Each image has 'name', 'size', 'time' fields.
+            Results are cached for API_CACHE_TTL seconds.
         """
+        gallery_images = await self._cached(
+            f"{ENDPOINT_GALLERY}?{gallery_name}&{offset}&{limit}",
+            lambda: self._fetch_gallery_images(gallery_name, offset, limit),
+        )
+        return gallery_images if gallery_images is not None else {"data": []}
+
+    async def _fetch_gallery_images(
+        self,
+        gallery_name: str,
+        offset: int,
+        limit: int
+    ) -> dict[str, Any] | None:
+        """Fetch a page of gallery images from the device, bypassing the cache; None on failure."""
         try:
             params = {
                 "gallery_name": gallery_name,
@@ -412,7 +477,7 @@ class EinkCanvasApiClient:
                 "limit": limit
             }
             async with self._session.get(
-                f"http://{self._host}/gallery",
+                f"http://{self._host}{ENDPOINT_GALLERY}",
                 params=params
             ) as response:
                 if response.status == 200:
@@ -421,7 +486,7 @@ class EinkCanvasApiClient:
                         return json.loads(text_response)
                     except json.JSONDecodeError as err:
                         _LOGGER.error("Failed to parse gallery images response: %s", err)
-                return {"data": []}
+                return None
         except Exception as err:
             _LOGGER.error("Error getting gallery images: %s", err)
-            return {"data": []}
+            return None
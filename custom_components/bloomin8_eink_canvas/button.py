@@ -43,18 +43,14 @@ class EinkBaseButton(ButtonEntity):
         self._config_entry = config_entry
         self._host = host
         self._device_name = device_name
-        self._attr_has_entity_name = True
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._host)},
-            name=self._device_name,
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, host)},
+            name=device_name,
             manufacturer="BLOOMIN8",
             model="E-Ink Canvas",
-            # configuration_url=f"http://{self._host}",  # Disabled to prevent external access
+            # configuration_url=f"http://{host}",  # Disabled to prevent external access
         )
+        self._attr_has_entity_name = True
 
 
 class EinkNextImageButton(EinkBaseButton):
@@ -17,6 +17,7 @@ from .const import (
     CONF_ORIENTATION,
     CONF_FILL_MODE,
     CONF_CONTAIN_COLOR,
+    CONF_JPEG_QUALITY,
     ORIENTATION_PORTRAIT,
     ORIENTATION_LANDSCAPE,
     FILL_MODE_CONTAIN,
@@ -25,6 +26,7 @@ from .const import (
     DEFAULT_ORIENTATION,
     DEFAULT_FILL_MODE,
     DEFAULT_CONTAIN_COLOR,
+    DEFAULT_JPEG_QUALITY,
     CONTAIN_COLORS,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_AUTH,
@@ -83,6 +85,7 @@ class EinkDisplayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_ORIENTATION, default=reconfigure_entry.data.get(CONF_ORIENTATION, DEFAULT_ORIENTATION)): vol.In([ORIENTATION_PORTRAIT, ORIENTATION_LANDSCAPE]),
                 vol.Required(CONF_FILL_MODE, default=reconfigure_entry.data.get(CONF_FILL_MODE, DEFAULT_FILL_MODE)): vol.In([FILL_MODE_AUTO, FILL_MODE_CONTAIN, FILL_MODE_COVER]),
                 vol.Required(CONF_CONTAIN_COLOR, default=reconfigure_entry.data.get(CONF_CONTAIN_COLOR, DEFAULT_CONTAIN_COLOR)): vol.In(list(CONTAIN_COLORS.keys())),
+                vol.Required(CONF_JPEG_QUALITY, default=reconfigure_entry.data.get(CONF_JPEG_QUALITY, DEFAULT_JPEG_QUALITY)): vol.All(vol.Coerce(int), vol.Range(min=50, max=100)),
             }),
             errors=errors,
         )
@@ -114,6 +117,7 @@ class EinkDisplayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_ORIENTATION, default=DEFAULT_ORIENTATION): vol.In([ORIENTATION_PORTRAIT, ORIENTATION_LANDSCAPE]),
                 vol.Required(CONF_FILL_MODE, default=DEFAULT_FILL_MODE): vol.In([FILL_MODE_AUTO, FILL_MODE_CONTAIN, FILL_MODE_COVER]),
                 vol.Required(CONF_CONTAIN_COLOR, default=DEFAULT_CONTAIN_COLOR): vol.In(list(CONTAIN_COLORS.keys())),
+                vol.Required(CONF_JPEG_QUALITY, default=DEFAULT_JPEG_QUALITY): vol.All(vol.Coerce(int), vol.Range(min=50, max=100)),
             }),
             errors=errors,
         )
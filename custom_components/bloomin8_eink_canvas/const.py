@@ -30,6 +30,9 @@ ENDPOINT_PLAYLIST = "/playlist"  # Endpoint for playlist operations (GET/PUT/DEL
 
 # Default Values
 DEFAULT_NAME = "BLOOMIN8 Canvas"  # Default name for the device
+API_CACHE_TTL = 10  # Seconds to reuse device info / gallery listings between reads
+GALLERY_PREFETCH_CONCURRENCY = 4  # Max parallel gallery listings requested from the device
+GALLERY_PREFETCH_LIMIT = 8  # Only the first galleries are prefetched when browsing
 
 # Image Settings
 # Note: Resolution is now detected dynamically from device info (width/height fields)
@@ -38,12 +41,15 @@ DEFAULT_NAME = "BLOOMIN8 Canvas"  # Default name for the device
 #   13.3" Canvas: 1200x1600
 #   28.5" Canvas: 2160x3060
 SUPPORTED_FORMATS = ["JPEG", "JPG", "PNG", "GIF", "BMP", "WEBP"]  # Supported input image formats that will be converted to JPEG
+UPLOAD_CACHE_SIZE = 32  # Recently uploaded images remembered for re-show without re-upload
+MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024  # Refuse image downloads larger than this
 
 # Configuration
 CONF_NAME = "name"
 CONF_ORIENTATION = "orientation"
 CONF_FILL_MODE = "fill_mode"
 CONF_CONTAIN_COLOR = "contain_color"
+CONF_JPEG_QUALITY = "jpeg_quality"
 
 # Image processing options
 ORIENTATION_PORTRAIT = "portrait"
@@ -57,6 +63,7 @@ FILL_MODE_AUTO = "auto"
 DEFAULT_ORIENTATION = ORIENTATION_PORTRAIT
 DEFAULT_FILL_MODE = FILL_MODE_AUTO
 DEFAULT_CONTAIN_COLOR = "white"
+DEFAULT_JPEG_QUALITY = 85  # Visually lossless on e-ink, ~40% smaller than 95
 
 # Background colors for contain mode (key must be lowercase alphanumeric for HA translations)
 CONTAIN_COLORS = {
@@ -1,10 +1,13 @@
 """Support for BLOOMIN8 E-Ink Canvas."""
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+import hashlib
+import itertools
 import logging
 import os
 import time
-from datetime import datetime
 from io import BytesIO
 
 from PIL import Image
@@ -34,6 +37,7 @@ from .const import (
     CONF_ORIENTATION,
     CONF_FILL_MODE,
     CONF_CONTAIN_COLOR,
+    CONF_JPEG_QUALITY,
     ORIENTATION_LANDSCAPE,
     FILL_MODE_CONTAIN,
     FILL_MODE_COVER,
@@ -41,12 +45,23 @@ from .const import (
     DEFAULT_ORIENTATION,
     DEFAULT_FILL_MODE,
     DEFAULT_CONTAIN_COLOR,
+    DEFAULT_JPEG_QUALITY,
     CONTAIN_COLORS,
+    GALLERY_PREFETCH_CONCURRENCY,
+    GALLERY_PREFETCH_LIMIT,
+    UPLOAD_CACHE_SIZE,
+    MAX_DOWNLOAD_BYTES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _is_image_item(item: BrowseMedia) -> bool:
+    """Return True if a media source item is an image."""
+    content_type = item.media_content_type
+    return bool(content_type) and (content_type == 'image' or content_type.startswith('image/'))
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -75,7 +90,14 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         self.hass = hass
         self._config_entry = config_entry
         self._host = host
+        self._url_prefix = f"http://{host}"
         self._device_name = name
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, host)},
+            name=name,
+            manufacturer="BLOOMIN8",
+            model="E-Ink Canvas",
+        )
         self._attr_name = "Media Player"
         self._attr_unique_id = f"eink_display_{host}_media_player"
         self._attr_state = MediaPlayerState.ON
@@ -85,16 +107,20 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         self._device_info = None
         self._screen_width = None
         self._screen_height = None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._host)},
-            name=self._device_name,
-            manufacturer="BLOOMIN8",
-            model="E-Ink Canvas",
-        )
+        # Contain-mode background: color key (e.g., "white") -> hex -> RGB, resolved once
+        # (reconfiguring reloads the entry)
+        self._contain_rgb = self._hex_to_rgb(CONTAIN_COLORS.get(
+            config_entry.data.get(CONF_CONTAIN_COLOR, DEFAULT_CONTAIN_COLOR), "#FFFFFF"
+        ))
+        # (source hash + processing settings) -> (filename, gallery) of a previous upload
+        self._upload_cache: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        # Disambiguates uploads generated within the same millisecond
+        self._upload_seq = itertools.count()
+        # Browse trees keyed by content id, paired with the API response they were built from
+        self._browse_cache: dict[str, tuple[object, BrowseMedia]] = {}
+        self._browse_root_media: BrowseMedia | None = None
+        # Gallery names the listing prefetch last ran for
+        self._prefetched_galleries: list[str] | None = None
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -104,7 +130,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
 
         return {
             "device_name": self._device_info.get("name"),
-            "current_image": self._device_info.get("image", "").split("/")[-1] if self._device_info.get("image") else "None",
+            "current_image": (self._device_info.get("image") or "").rpartition("/")[2] or "None",
             "battery_level": f"{self._device_info.get('battery', 0)}%",
             "wifi_network": self._device_info.get("sta_ssid"),
             "ip_address": self._device_info.get("sta_ip"),
@@ -116,7 +142,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
     def media_image_url(self) -> str | None:
         """Return the current image URL for display."""
         if self._device_info and self._device_info.get("image"):
-            return f"http://{self._host}{self._device_info['image']}"
+            return self._url_prefix + self._device_info["image"]
         return None
 
     @property
@@ -125,8 +151,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         if not self._device_info or not self._device_info.get("image"):
             return None
 
-        image_path = self._device_info.get("image", "")
-        return image_path.split("/")[-1] if "/" in image_path else image_path
+        return self._device_info["image"].rpartition("/")[2]
 
     async def async_update(self) -> None:
         """Update device state and information."""
@@ -192,9 +217,19 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
 
         try:
             # Add log
-            await self._add_log(f"Playing media: {media_id}")
+            self._add_log(f"Playing media: {media_id}")
+
+            # Guard clause: Handle gallery images directly (no resolution or processing needed)
+            if media_id.startswith("/gallerys/"):
+                success = await api_client.show_image(media_id)
+                if success:
+                    self._add_log(f"Successfully displayed image via /show API: {media_id}")
+                else:
+                    self._add_log(f"Failed to show image: {media_id}", "error")
+                await self.async_update()
+                return
 
-            # Handle media source resolution first
+            # Handle media source resolution
             if media_source.is_media_source_id(media_id):
                 play_item = await media_source.async_resolve_media(
                     self.hass, media_id, self.entity_id
@@ -208,130 +243,267 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
                 await self.async_update()
 
             if self._screen_width is None or self._screen_height is None:
-                await self._add_log("Failed to detect screen resolution", "error")
+                self._add_log("Failed to detect screen resolution", "error")
                 return
 
-            # Guard clause: Handle gallery images directly
-            if media_id.startswith("/gallerys/"):
-                success = await api_client.show_image(media_id)
-                if success:
-                    await self._add_log(f"Successfully displayed image via /show API: {media_id}")
-                else:
-                    await self._add_log(f"Failed to show image: {media_id}", "error")
-                await self.async_update()
-                return
+            # Local file unchanged since a previous upload: show it without reading the file
+            cache_keys = []
+            if media_id.startswith("/"):
+                file_key = await self.hass.async_add_executor_job(self._file_cache_key, media_id)
+                if file_key is not None:
+                    if await self._show_cached_upload(file_key):
+                        return
+                    cache_keys.append(file_key)
 
             # Handle external images - upload and show
-            image_data = await self._load_image_data(media_id)
-            if not image_data:
-                await self._add_log(f"Failed to load image: {media_id}", "error")
+            loaded = await self._load_image_data(media_id)
+            if not loaded:
+                self._add_log(f"Failed to load image: {media_id}", "error")
                 return
+            image_data, content_key = loaded
+
+            # Same source bytes and settings as a previous upload: just show it again
+            if await self._show_cached_upload(content_key):
+                for key in cache_keys:
+                    self._remember_upload(key, self._upload_cache[content_key])
+                return
+            cache_keys.append(content_key)
 
             # Process image for e-ink display
             processed_image_data = await self._process_image(image_data)
             if not processed_image_data:
-                await self._add_log("Failed to process image", "error")
+                self._add_log("Failed to process image", "error")
                 return
 
             # Generate filename and upload
-            filename = f"ha_{int(time.time() * 1000)}.jpg"
+            filename = f"ha_{time.time_ns() // 1_000_000}_{next(self._upload_seq)}.jpg"
             gallery = "default"
             uploaded_path = await api_client.upload_image(processed_image_data, filename, gallery=gallery)
             if not uploaded_path:
-                await self._add_log(f"Upload failed: {filename}", "error")
+                self._add_log(f"Upload failed: {filename}", "error")
                 return
 
-            await self._add_log(f"Successfully uploaded image: {uploaded_path}")
+            self._add_log(f"Successfully uploaded image: {uploaded_path}")
+            for key in cache_keys:
+                self._remember_upload(key, (filename, gallery))
 
             # Show the uploaded image - use play_type=0 (single image mode)
             success = await api_client.show_image_by_name(filename, gallery, play_type=0)
             if success:
-                await self._add_log(f"Successfully displayed uploaded image: {filename}")
+                self._add_log(f"Successfully displayed uploaded image: {filename}")
             else:
-                await self._add_log(f"Failed to show uploaded image: {filename}", "error")
+                self._add_log(f"Failed to show uploaded image: {filename}", "error")
 
             # Refresh device info
             await self.async_update()
 
         except Exception as err:
-            await self._add_log(f"Error playing media: {str(err)}", "error")
+            self._add_log(f"Error playing media: {str(err)}", "error")
             _LOGGER.error("Error playing media: %s", str(err))
 
-    async def _load_image_data(self, media_id: str) -> bytes | None:
-        """Load image data from file or URL."""
+    async def _show_cached_upload(self, cache_key: str) -> bool:
+        """Re-show a previously uploaded image for cache_key; return True on success."""
+        cached = self._upload_cache.get(cache_key)
+        if cached is None:
+            return False
+
+        filename, gallery = cached
+        api_client = self._config_entry.runtime_data.api_client
+        if not await api_client.show_image_by_name(filename, gallery, play_type=0):
+            # Image may have been deleted on the device, upload it again
+            del self._upload_cache[cache_key]
+            return False
+
+        self._upload_cache.move_to_end(cache_key)
+        self._add_log(f"Successfully displayed previously uploaded image: {filename}")
+        await self.async_update()
+        return True
+
+    def _remember_upload(self, cache_key: str, upload: tuple[str, str]) -> None:
+        """Record an uploaded (filename, gallery), evicting the least recently used entry."""
+        self._upload_cache[cache_key] = upload
+        self._upload_cache.move_to_end(cache_key)
+        if len(self._upload_cache) > UPLOAD_CACHE_SIZE:
+            self._upload_cache.popitem(last=False)
+
+    def _settings_cache_key(self) -> str:
+        """Return the part of upload cache keys that depends on processing settings."""
+        data = self._config_entry.data
+        return ":".join((
+            data.get(CONF_ORIENTATION, DEFAULT_ORIENTATION),
+            data.get(CONF_FILL_MODE, DEFAULT_FILL_MODE),
+            data.get(CONF_CONTAIN_COLOR, DEFAULT_CONTAIN_COLOR),
+            str(data.get(CONF_JPEG_QUALITY, DEFAULT_JPEG_QUALITY)),
+            f"{self._screen_width}x{self._screen_height}",
+        ))
+
+    def _upload_cache_key(self, image_data: bytes) -> str:
+        """Return the upload cache key for source bytes under the current settings."""
+        digest = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+        return f"{digest}:{self._settings_cache_key()}"
+
+    def _file_cache_key(self, path: str) -> str | None:
+        """Return the upload cache key for a local file's identity, or None if missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"file:{path}:{stat.st_mtime_ns}:{stat.st_size}:{self._settings_cache_key()}"
+
+    async def _load_image_data(self, media_id: str) -> tuple[bytes, str] | None:
+        """Load image data from file or URL, with its upload cache key."""
         # Handle URL
         if not media_id.startswith("/"):
             session = async_get_clientsession(self.hass)
-            async with session.get(media_id) as response:
+            # Images are already compressed; skip transport compression
+            async with session.get(media_id, headers={"Accept-Encoding": "identity"}) as response:
                 if response.status != 200:
                     _LOGGER.error("Failed to download image from URL: %s", response.status)
                     return None
-                return await response.read()
+                if response.content_length is not None and response.content_length > MAX_DOWNLOAD_BYTES:
+                    _LOGGER.error("Image too large to download: %d bytes", response.content_length)
+                    return None
 
-        # Handle local file
-        if not await self.hass.async_add_executor_job(os.path.exists, media_id):
-            _LOGGER.error("File does not exist: %s", media_id)
+                # Stream with a running size check; Content-Length may be absent or wrong
+                chunks = []
+                size = 0
+                async for chunk in response.content.iter_chunked(65536):
+                    size += len(chunk)
+                    if size > MAX_DOWNLOAD_BYTES:
+                        _LOGGER.error("Image download exceeded %d bytes, aborting", MAX_DOWNLOAD_BYTES)
+                        return None
+                    chunks.append(chunk)
+                image_data = b"".join(chunks)
+            if not image_data:
+                return None
+            content_key = await self.hass.async_add_executor_job(self._upload_cache_key, image_data)
+            return image_data, content_key
+
+        # Handle local file (single executor hop: open() doubles as the existence check,
+        # and the bytes are hashed in the same job)
+        loaded = await self.hass.async_add_executor_job(self._read_file_with_cache_key, media_id)
+        if loaded is None:
+            _LOGGER.error("File does not exist or is empty: %s", media_id)
+        return loaded
+
+    def _read_file_with_cache_key(self, path: str) -> tuple[bytes, str] | None:
+        """Read a local file and compute its upload cache key; None if missing or empty."""
+        image_data = self._read_file_if_exists(path)
+        if not image_data:
             return None
+        return image_data, self._upload_cache_key(image_data)
 
-        def read_file():
-            with open(media_id, "rb") as f:
+    @staticmethod
+    def _read_file_if_exists(path: str) -> bytes | None:
+        """Read a local file, returning None if it does not exist."""
+        try:
+            with open(path, "rb") as f:
+                if hasattr(os, "posix_fadvise"):
+                    # One-shot sequential read: keep large images out of the page cache
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_NOREUSE)
+                    except OSError:
+                        pass
                 return f.read()
-
-        return await self.hass.async_add_executor_job(read_file)
+        except FileNotFoundError:
+            return None
 
     async def _process_image(self, image_data: bytes) -> bytes | None:
         """Process image for e-ink display with orientation and fill mode support."""
         try:
             image = Image.open(BytesIO(image_data))
-            _LOGGER.info("Processing image: %s, size: %s", image.format, image.size)
+            _LOGGER.debug("Processing image: %s, size: %s", image.format, image.size)
 
             # Get configuration
             orientation = self._config_entry.data.get(CONF_ORIENTATION, DEFAULT_ORIENTATION)
             fill_mode = self._config_entry.data.get(CONF_FILL_MODE, DEFAULT_FILL_MODE)
             contain_color = self._config_entry.data.get(CONF_CONTAIN_COLOR, DEFAULT_CONTAIN_COLOR)
+            jpeg_quality = self._config_entry.data.get(CONF_JPEG_QUALITY, DEFAULT_JPEG_QUALITY)
 
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Image processing config - orientation: %s, fill_mode: %s, contain_color: %s",
                 orientation, fill_mode, contain_color
             )
 
-            # Convert to RGB if needed
-            image = await self.hass.async_add_executor_job(
-                self._convert_to_rgb, image
-            )
+            # Already a baseline RGB JPEG at the panel's native portrait size: processing
+            # would be an identity resize, so upload the original bytes. Files carrying an
+            # ICC profile or EXIF are re-encoded, which strips them (the firmware may fail
+            # to decode images with an unexpected colour profile)
+            if (
+                orientation != ORIENTATION_LANDSCAPE
+                and image.format == "JPEG"
+                and image.mode == "RGB"
+                and image.size == (self._screen_width, self._screen_height)
+                and not image.info.get("progressive")
+                and "icc_profile" not in image.info
+                and "exif" not in image.info
+            ):
+                _LOGGER.debug("Image already matches display format, skipping re-encode")
+                return image_data
+
+            # Let libjpeg decode large JPEGs at 1/2, 1/4 or 1/8 scale; draft keeps both
+            # sides at or above the canvas, which cover and contain both need
+            if image.format == "JPEG":
+                if orientation == ORIENTATION_LANDSCAPE:
+                    canvas_size = (self._screen_height, self._screen_width)
+                else:
+                    canvas_size = (self._screen_width, self._screen_height)
+                image.draft(None, canvas_size)
 
-            # Process image with orientation and fill mode
-            image = await self.hass.async_add_executor_job(
-                self._process_with_orientation,
+            # All Pillow work in one hop on the integration's own worker thread
+            return await self.hass.loop.run_in_executor(
+                self._config_entry.runtime_data.image_executor,
+                self._render_jpeg,
                 image,
                 orientation,
                 fill_mode,
-                contain_color
+                jpeg_quality
             )
 
-            # Convert to JPEG
-            def save_image():
-                img_byte_arr = BytesIO()
-                image.save(img_byte_arr, format='JPEG', quality=95)
-                return img_byte_arr.getvalue()
-
-            return await self.hass.async_add_executor_job(save_image)
-
         except Exception as err:
             _LOGGER.error("Error processing image: %s", err)
             return None
 
+    def _render_jpeg(
+        self,
+        image: Image.Image,
+        orientation: str,
+        fill_mode: str,
+        jpeg_quality: int
+    ) -> bytes:
+        """Decode, convert, fit and encode an image for the device (runs in executor)."""
+        image = self._convert_to_rgb(image)
+        image = self._process_with_orientation(image, orientation, fill_mode)
+
+        # Convert to JPEG: baseline, 8-bit RGB (the colour panels reject grayscale/progressive),
+        # with 4:2:0 chroma subsampling to keep the chroma scans small
+        img_byte_arr = BytesIO()
+        image.save(
+            img_byte_arr,
+            format='JPEG',
+            quality=jpeg_quality,
+            subsampling=2,
+            optimize=True,
+            progressive=False,
+        )
+        return img_byte_arr.getvalue()
+
     def _convert_to_rgb(self, image: Image.Image) -> Image.Image:
         """Convert image to RGB format."""
+        if image.mode == 'RGB':
+            return image
         if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
-            background = Image.new('RGB', image.size, (255, 255, 255))
             if image.mode == 'P':
                 image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1])
+            alpha = image.getchannel('A')
+            # Fully opaque (common for screenshots): plain conversion, no composite
+            if alpha.getextrema() == (255, 255):
+                return image.convert('RGB')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=alpha)
             return background
-        elif image.mode != 'RGB':
-            return image.convert('RGB')
-        return image
+        return image.convert('RGB')
 
     def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
         """Convert hex color string to RGB tuple."""
@@ -347,8 +519,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         self,
         image: Image.Image,
         orientation: str,
-        fill_mode: str,
-        contain_color: str
+        fill_mode: str
     ) -> Image.Image:
         """Process image based on orientation and fill mode settings.
 
@@ -382,7 +553,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         else:
             actual_fill_mode = fill_mode
 
-        _LOGGER.info(
+        _LOGGER.debug(
             "Processing: image %dx%d (%s), canvas %dx%d (%s), fill_mode: %s -> %s",
             image.width, image.height,
             "landscape" if image_is_landscape else "portrait",
@@ -395,17 +566,14 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         if actual_fill_mode == FILL_MODE_COVER:
             processed = self._cover_image(image, target_width, target_height)
         else:  # FILL_MODE_CONTAIN
-            # Convert color key (e.g., "white") to hex value (e.g., "#FFFFFF")
-            hex_color = CONTAIN_COLORS.get(contain_color, "#FFFFFF")
-            bg_color = self._hex_to_rgb(hex_color)
-            processed = self._contain_image(image, target_width, target_height, bg_color)
+            processed = self._contain_image(image, target_width, target_height, self._contain_rgb)
 
         # If landscape orientation, rotate 90° clockwise to make it portrait for API
         if canvas_is_landscape:
             processed = processed.rotate(-90, expand=True)
-            _LOGGER.info("Rotated image for landscape display: %dx%d", processed.width, processed.height)
+            _LOGGER.debug("Rotated image for landscape display: %dx%d", processed.width, processed.height)
 
-        _LOGGER.info("Final processed image size: %dx%d", processed.width, processed.height)
+        _LOGGER.debug("Final processed image size: %dx%d", processed.width, processed.height)
         return processed
 
     def _cover_image(
@@ -414,31 +582,29 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         target_width: int,
         target_height: int
     ) -> Image.Image:
-        """Scale and crop image to cover the target area (center crop)."""
+        """Scale and crop image to cover the target area (center crop).
+
+        The crop is expressed as a source box so Pillow resamples only the
+        visible region straight to the target size, without an intermediate image.
+        """
         image_aspect = image.width / image.height
         target_aspect = target_width / target_height
 
         if image_aspect > target_aspect:
-            # Image is wider - fit to height, crop width
-            scaled_height = target_height
-            scaled_width = int(target_height * image_aspect)
+            # Image is wider - use full height, crop width
+            crop_width = image.height * target_aspect
+            x_offset = (image.width - crop_width) / 2
+            box = (x_offset, 0, x_offset + crop_width, image.height)
         else:
-            # Image is taller - fit to width, crop height
-            scaled_width = target_width
-            scaled_height = int(target_width / image_aspect)
-
-        # Scale image
-        scaled_image = image.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
-
-        # Center crop
-        x_offset = (scaled_width - target_width) // 2
-        y_offset = (scaled_height - target_height) // 2
-        return scaled_image.crop((
-            x_offset,
-            y_offset,
-            x_offset + target_width,
-            y_offset + target_height
-        ))
+            # Image is taller - use full width, crop height
+            crop_height = image.width / target_aspect
+            y_offset = (image.height - crop_height) / 2
+            box = (0, y_offset, image.width, y_offset + crop_height)
+
+        # reducing_gap: box-shrink large sources first so LANCZOS sees at most ~2x the output
+        return image.resize(
+            (target_width, target_height), Image.Resampling.LANCZOS, box=box, reducing_gap=2.0
+        )
 
     def _contain_image(
         self,
@@ -460,8 +626,10 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
             scaled_height = target_height
             scaled_width = int(target_height * image_aspect)
 
-        # Scale image
-        scaled_image = image.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+        # Scale image (box-shrink first for large downscales, then LANCZOS)
+        scaled_image = image.resize(
+            (scaled_width, scaled_height), Image.Resampling.LANCZOS, reducing_gap=2.0
+        )
 
         # Create background and paste centered
         background = Image.new('RGB', (target_width, target_height), bg_color)
@@ -485,19 +653,13 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
                 return await media_source.async_browse_media(
                     self.hass,
                     None,
-                    content_filter=lambda item: item.media_content_type and (
-                        item.media_content_type.startswith('image/')
-                        or item.media_content_type == 'image'
-                    )
+                    content_filter=_is_image_item,
                 )
             else:
                 return await media_source.async_browse_media(
                     self.hass,
                     media_content_id,
-                    content_filter=lambda item: item.media_content_type and (
-                        item.media_content_type.startswith('image/')
-                        or item.media_content_type == 'image'
-                    )
+                    content_filter=_is_image_item,
                 )
         except Exception as err:
             _LOGGER.error("Error browsing media: %s", str(err))
@@ -513,6 +675,9 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
 
     async def _browse_root(self) -> BrowseMedia:
         """Browse root level - show device galleries and local media."""
+        if self._browse_root_media is not None:
+            return self._browse_root_media
+
         children = [
             BrowseMedia(
                 title="Device Galleries",
@@ -534,7 +699,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
             ),
         ]
 
-        return BrowseMedia(
+        self._browse_root_media = BrowseMedia(
             title="Media Browser",
             media_class=MediaClass.DIRECTORY,
             media_content_type="directory",
@@ -543,6 +708,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
             can_expand=True,
             children=children,
         )
+        return self._browse_root_media
 
     async def _browse_galleries(self) -> BrowseMedia:
         """Browse available galleries."""
@@ -550,21 +716,36 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         api_client = runtime_data.api_client
 
         galleries_data = await api_client.get_galleries()
-        children = []
 
-        for gallery in galleries_data:
-            gallery_name = gallery.get("name", "")
-            children.append(BrowseMedia(
+        # Same cached API response as last time: reuse the tree built from it
+        cached = self._browse_cache.get("device_galleries")
+        if cached is not None and cached[0] is galleries_data:
+            return cached[1]
+
+        # Warm the listing cache for the first galleries, only when the listing changed
+        gallery_names = [gallery.get("name", "") for gallery in galleries_data]
+        if gallery_names and gallery_names != self._prefetched_galleries:
+            self._prefetched_galleries = gallery_names
+            self.hass.async_create_background_task(
+                self._prefetch_gallery_images(gallery_names[:GALLERY_PREFETCH_LIMIT]),
+                f"{DOMAIN} prefetch gallery listings",
+            )
+
+        directory = MediaClass.DIRECTORY
+        children = [
+            BrowseMedia(
                 title=gallery_name,
-                media_class=MediaClass.DIRECTORY,
+                media_class=directory,
                 media_content_type="directory",
                 media_content_id=f"gallery:{gallery_name}",
                 can_play=False,
                 can_expand=True,
                 thumbnail=None,
-            ))
+            )
+            for gallery_name in gallery_names
+        ]
 
-        return BrowseMedia(
+        browse = BrowseMedia(
             title="Device Galleries",
             media_class=MediaClass.DIRECTORY,
             media_content_type="directory",
@@ -573,6 +754,19 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
             can_expand=True,
             children=children,
         )
+        self._browse_cache["device_galleries"] = (galleries_data, browse)
+        return browse
+
+    async def _prefetch_gallery_images(self, gallery_names: list[str]) -> None:
+        """Fetch gallery listings concurrently, bounded to spare the device."""
+        api_client = self._config_entry.runtime_data.api_client
+        semaphore = asyncio.Semaphore(GALLERY_PREFETCH_CONCURRENCY)
+
+        async def fetch(gallery_name: str) -> None:
+            async with semaphore:
+                await api_client.get_gallery_images(gallery_name)
+
+        await asyncio.gather(*(fetch(name) for name in gallery_names))
 
     async def _browse_gallery_images(self, gallery_name: str) -> BrowseMedia:
         """Browse images in a specific gallery."""
@@ -580,39 +774,42 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         api_client = runtime_data.api_client
 
         gallery_data = await api_client.get_gallery_images(gallery_name)
-        children = []
 
-        for image in gallery_data.get("data", []):
-            image_name = image.get("name", "")
-            image_path = f"/gallerys/{gallery_name}/{image_name}"
+        # Same cached API response as last time: reuse the tree built from it
+        cache_key = f"gallery:{gallery_name}"
+        cached = self._browse_cache.get(cache_key)
+        if cached is not None and cached[0] is gallery_data:
+            return cached[1]
 
-            children.append(BrowseMedia(
+        # Hoist per-gallery prefixes and lookups out of the per-image loop
+        path_prefix = f"/gallerys/{gallery_name}/"
+        url_prefix = self._url_prefix + path_prefix
+        image_class = MediaClass.IMAGE
+        children = [
+            BrowseMedia(
                 title=image_name,
-                media_class=MediaClass.IMAGE,
+                media_class=image_class,
                 media_content_type="image/jpeg",
-                media_content_id=image_path,
+                media_content_id=path_prefix + image_name,
                 can_play=True,
                 can_expand=False,
-                thumbnail=f"http://{self._host}{image_path}",
-            ))
+                thumbnail=url_prefix + image_name,
+            )
+            for image_name in (image.get("name", "") for image in gallery_data.get("data", ()))
+        ]
 
-        return BrowseMedia(
+        browse = BrowseMedia(
             title=f"Gallery: {gallery_name}",
             media_class=MediaClass.DIRECTORY,
             media_content_type="directory",
-            media_content_id=f"gallery:{gallery_name}",
+            media_content_id=cache_key,
             can_play=False,
             can_expand=True,
             children=children,
         )
+        self._browse_cache[cache_key] = (gallery_data, browse)
+        return browse
 
-    async def _add_log(self, message: str, level: str = "info") -> None:
+    def _add_log(self, message: str, level: str = "info") -> None:
         """Add log entry."""
-        runtime_data = self._config_entry.runtime_data
-        runtime_data.logs.append({
-            "timestamp": datetime.now(),
-            "level": level,
-            "message": message,
-        })
-        if len(runtime_data.logs) > 50:
-            runtime_data.logs.pop(0)
+        self._config_entry.runtime_data.add_log(message, level)
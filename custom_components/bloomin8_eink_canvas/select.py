@@ -49,6 +49,16 @@ WAKE_SENSITIVITY_OPTIONS = {
     "very high": 5,
 }
 
+# Option lists shared by all entities (lists, as the entity registry stores them)
+SLEEP_DURATION_OPTION_KEYS = list(SLEEP_DURATION_OPTIONS)
+MAX_IDLE_OPTION_KEYS = list(MAX_IDLE_OPTIONS)
+WAKE_SENSITIVITY_OPTION_KEYS = list(WAKE_SENSITIVITY_OPTIONS)
+
+# Reverse mappings (device value -> option) for O(1) lookups on update
+SLEEP_DURATION_VALUES = {value: option for option, value in SLEEP_DURATION_OPTIONS.items()}
+MAX_IDLE_VALUES = {value: option for option, value in MAX_IDLE_OPTIONS.items()}
+WAKE_SENSITIVITY_VALUES = {value: option for option, value in WAKE_SENSITIVITY_OPTIONS.items()}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -70,24 +80,29 @@ async def async_setup_entry(
 class EinkBaseSelect(SelectEntity):
     """Base class for BLOOMIN8 E-Ink Canvas select inputs."""
 
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.CONFIG
+
+    # Device setting shown by the select, set by subclasses
+    _setting_key: str
+    _setting_label: str
+    _setting_default: int
+    _setting_options: dict[str, int]
+    _setting_values: dict[int, str]
+    _default_option: str
+
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, host: str, device_name: str) -> None:
         """Initialize the select input."""
         self.hass = hass
         self._config_entry = config_entry
         self._host = host
         self._device_name = device_name
-        self._attr_has_entity_name = True
-        self._attr_entity_category = EntityCategory.CONFIG
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._host)},
-            name=self._device_name,
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, host)},
+            name=device_name,
             manufacturer="BLOOMIN8",
             model="E-Ink Canvas",
-            # configuration_url=f"http://{self._host}",  # Disabled to prevent external access
+            # configuration_url=f"http://{host}",  # Disabled to prevent external access
         )
 
     def _get_device_info(self) -> dict | None:
@@ -95,158 +110,101 @@ class EinkBaseSelect(SelectEntity):
         runtime_data = self._config_entry.runtime_data
         return runtime_data.device_info
 
-
-class EinkSleepDurationSelect(EinkBaseSelect):
-    """Select input for sleep duration setting."""
-
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, host: str, device_name: str) -> None:
-        """Initialize the select input."""
-        super().__init__(hass, config_entry, host, device_name)
-        self._attr_name = "Sleep Duration"
-        self._attr_unique_id = f"eink_display_{host}_sleep_duration"
-        self._attr_icon = "mdi:sleep"
-        self._attr_options = list(SLEEP_DURATION_OPTIONS.keys())
-
     async def async_update(self) -> None:
         """Update the select input value."""
         device_info = self._get_device_info()
         if device_info:
-            current_value = device_info.get("sleep_duration", 86400)
-            # Find the matching option
-            for option, value in SLEEP_DURATION_OPTIONS.items():
-                if value == current_value:
-                    self._attr_current_option = option
-                    return
-            # Default to 1 day if no match found
-            self._attr_current_option = "1 day"
+            current_value = device_info.get(self._setting_key, self._setting_default)
+            self._attr_current_option = self._setting_values.get(current_value, self._default_option)
         else:
-            self._attr_current_option = "1 day"
+            self._attr_current_option = self._default_option
 
     async def async_select_option(self, option: str) -> None:
-        """Set the sleep duration."""
-        if option not in SLEEP_DURATION_OPTIONS:
-            _LOGGER.error("Invalid sleep duration option: %s", option)
+        """Set the device setting to the selected option."""
+        if option not in self._setting_options:
+            _LOGGER.error("Invalid %s option: %s", self._setting_label, option)
             return
 
         # Get current device settings
         device_info = self._get_device_info()
         if not device_info:
-            _LOGGER.error("Cannot update sleep duration: device info not available")
+            _LOGGER.error("Cannot update %s: device info not available", self._setting_label)
             return
 
-        # Call update_settings service with new sleep duration
+        # Call update_settings service with the new value
+        settings = self._current_settings(device_info)
+        settings[self._setting_key] = self._setting_options[option]
         await self.hass.services.async_call(
             DOMAIN,
             "update_settings",
-            {
-                "name": device_info.get("name", "E-Ink Canvas"),
-                "sleep_duration": SLEEP_DURATION_OPTIONS[option],
-                "max_idle": device_info.get("max_idle", 300),
-                "idx_wake_sens": device_info.get("idx_wake_sens", 3),
-            },
+            settings,
             blocking=True,
         )
 
+    @staticmethod
+    def _current_settings(device_info: dict) -> dict:
+        """Build the update_settings payload from the device's current settings."""
+        get = device_info.get
+        return {
+            "name": get("name", "E-Ink Canvas"),
+            "sleep_duration": get("sleep_duration", 86400),
+            "max_idle": get("max_idle", 300),
+            "idx_wake_sens": get("idx_wake_sens", 3),
+        }
 
-class EinkMaxIdleSelect(EinkBaseSelect):
-    """Select input for max idle time setting."""
+
+class EinkSleepDurationSelect(EinkBaseSelect):
+    """Select input for sleep duration setting."""
+
+    _attr_name = "Sleep Duration"
+    _attr_icon = "mdi:sleep"
+    _attr_options = SLEEP_DURATION_OPTION_KEYS
+    _setting_key = "sleep_duration"
+    _setting_label = "sleep duration"
+    _setting_default = 86400
+    _setting_options = SLEEP_DURATION_OPTIONS
+    _setting_values = SLEEP_DURATION_VALUES
+    _default_option = "1 day"
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, host: str, device_name: str) -> None:
         """Initialize the select input."""
         super().__init__(hass, config_entry, host, device_name)
-        self._attr_name = "Max Idle Time"
-        self._attr_unique_id = f"eink_display_{host}_max_idle"
-        self._attr_icon = "mdi:timer"
-        self._attr_options = list(MAX_IDLE_OPTIONS.keys())
+        self._attr_unique_id = f"eink_display_{host}_sleep_duration"
 
-    async def async_update(self) -> None:
-        """Update the select input value."""
-        device_info = self._get_device_info()
-        if device_info:
-            current_value = device_info.get("max_idle", 300)
-            # Find the matching option
-            for option, value in MAX_IDLE_OPTIONS.items():
-                if value == current_value:
-                    self._attr_current_option = option
-                    return
-            # Default to 5 minutes if no match found
-            self._attr_current_option = "5 minutes"
-        else:
-            self._attr_current_option = "5 minutes"
 
-    async def async_select_option(self, option: str) -> None:
-        """Set the max idle time."""
-        if option not in MAX_IDLE_OPTIONS:
-            _LOGGER.error("Invalid max idle option: %s", option)
-            return
+class EinkMaxIdleSelect(EinkBaseSelect):
+    """Select input for max idle time setting."""
 
-        # Get current device settings
-        device_info = self._get_device_info()
-        if not device_info:
-            _LOGGER.error("Cannot update max idle time: device info not available")
-            return
+    _attr_name = "Max Idle Time"
+    _attr_icon = "mdi:timer"
+    _attr_options = MAX_IDLE_OPTION_KEYS
+    _setting_key = "max_idle"
+    _setting_label = "max idle time"
+    _setting_default = 300
+    _setting_options = MAX_IDLE_OPTIONS
+    _setting_values = MAX_IDLE_VALUES
+    _default_option = "5 minutes"
 
-        # Call update_settings service with new max idle time
-        await self.hass.services.async_call(
-            DOMAIN,
-            "update_settings",
-            {
-                "name": device_info.get("name", "E-Ink Canvas"),
-                "sleep_duration": device_info.get("sleep_duration", 86400),
-                "max_idle": MAX_IDLE_OPTIONS[option],
-                "idx_wake_sens": device_info.get("idx_wake_sens", 3),
-            },
-            blocking=True,
-        )
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, host: str, device_name: str) -> None:
+        """Initialize the select input."""
+        super().__init__(hass, config_entry, host, device_name)
+        self._attr_unique_id = f"eink_display_{host}_max_idle"
 
 
 class EinkWakeSensitivitySelect(EinkBaseSelect):
     """Select input for wake sensitivity setting."""
 
+    _attr_name = "Wake Sensitivity"
+    _attr_icon = "mdi:gesture-tap"
+    _attr_options = WAKE_SENSITIVITY_OPTION_KEYS
+    _setting_key = "idx_wake_sens"
+    _setting_label = "wake sensitivity"
+    _setting_default = 3
+    _setting_options = WAKE_SENSITIVITY_OPTIONS
+    _setting_values = WAKE_SENSITIVITY_VALUES
+    _default_option = "medium"
+
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, host: str, device_name: str) -> None:
         """Initialize the select input."""
         super().__init__(hass, config_entry, host, device_name)
-        self._attr_name = "Wake Sensitivity"
         self._attr_unique_id = f"eink_display_{host}_wake_sensitivity"
-        self._attr_icon = "mdi:gesture-tap"
-        self._attr_options = list(WAKE_SENSITIVITY_OPTIONS.keys())
-
-    async def async_update(self) -> None:
-        """Update the select input value."""
-        device_info = self._get_device_info()
-        if device_info:
-            current_value = device_info.get("idx_wake_sens", 3)
-            # Find the matching option
-            for option, value in WAKE_SENSITIVITY_OPTIONS.items():
-                if value == current_value:
-                    self._attr_current_option = option
-                    return
-            # Default to medium if no match found
-            self._attr_current_option = "medium"
-        else:
-            self._attr_current_option = "medium"
-
-    async def async_select_option(self, option: str) -> None:
-        """Set the wake sensitivity."""
-        if option not in WAKE_SENSITIVITY_OPTIONS:
-            _LOGGER.error("Invalid wake sensitivity option: %s", option)
-            return
-
-        # Get current device settings
-        device_info = self._get_device_info()
-        if not device_info:
-            _LOGGER.error("Cannot update wake sensitivity: device info not available")
-            return
-
-        # Call update_settings service with new wake sensitivity
-        await self.hass.services.async_call(
-            DOMAIN,
-            "update_settings",
-            {
-                "name": device_info.get("name", "E-Ink Canvas"),
-                "sleep_duration": device_info.get("sleep_duration", 86400),
-                "max_idle": device_info.get("max_idle", 300),
-                "idx_wake_sens": WAKE_SENSITIVITY_OPTIONS[option],
-            },
-            blocking=True,
-        ) 
\ No newline at end of file
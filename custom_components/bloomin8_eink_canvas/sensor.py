@@ -1,6 +1,7 @@
 """Support for BLOOMIN8 E-Ink Canvas sensors."""
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 
 from homeassistant.components.sensor import (
@@ -21,6 +22,31 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Canvas model by screen resolution (width, height)
+CANVAS_MODELS = {
+    (480, 800): "7.3\" Canvas",
+    (1200, 1600): "13.3\" Canvas",
+    (2160, 3060): "28.5\" Canvas",
+}
+
+_GB = 1024 ** 3
+_MB = 1024 ** 2
+_KB = 1024
+
+
+@lru_cache(maxsize=128)
+def _format_bytes(bytes_val: int) -> str:
+    """Convert bytes to appropriate units for display."""
+    if bytes_val >= _GB:
+        return f"{round(bytes_val / _GB, 2)} GB"
+    elif bytes_val >= _MB:
+        return f"{round(bytes_val / _MB, 1)} MB"
+    elif bytes_val >= _KB:
+        return f"{round(bytes_val / _KB, 1)} KB"
+    else:
+        return f"{bytes_val} B"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -53,18 +79,14 @@ class EinkBaseSensor(SensorEntity):
         self._config_entry = config_entry
         self._host = host
         self._device_name = device_name
-        self._attr_has_entity_name = True
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._host)},
-            name=self._device_name,
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, host)},
+            name=device_name,
             manufacturer="BLOOMIN8",
             model="E-Ink Canvas",
-            # configuration_url=f"http://{self._host}",  # Disabled to prevent external access
+            # configuration_url=f"http://{host}",  # Disabled to prevent external access
         )
+        self._attr_has_entity_name = True
 
     def _get_device_info(self) -> dict | None:
         """Get device info from shared runtime data."""
@@ -101,6 +123,8 @@ class EinkDeviceInfoSensor(EinkBaseSensor):
             device_info = await self._fetch_device_info()
         
         if device_info:
+            width = device_info.get("width", 0)
+            height = device_info.get("height", 0)
             self._attr_native_value = "Online"
             self._attr_extra_state_attributes = {
                 "device_name": device_info.get("name"),
@@ -110,9 +134,9 @@ class EinkDeviceInfoSensor(EinkBaseSensor):
                 "network_type": device_info.get("network_type"),
                 "wifi_ssid": device_info.get("sta_ssid"),
                 "ip_address": device_info.get("sta_ip"),
-                "resolution": f"{device_info.get('width', 0)}x{device_info.get('height', 0)}",
-                "screen_width": device_info.get("width", 0),
-                "screen_height": device_info.get("height", 0),
+                "resolution": f"{width}x{height}",
+                "screen_width": width,
+                "screen_height": height,
                 "sleep_duration": device_info.get("sleep_duration"),
                 "max_idle": device_info.get("max_idle"),
                 "gallery": device_info.get("gallery"),
@@ -165,48 +189,40 @@ class EinkStorageSensor(EinkBaseSensor):
         if not device_info:
             device_info = await self._fetch_device_info()
         
-        if device_info:
-            total_size = device_info.get("total_size", 0)
-            free_size = device_info.get("free_size", 0)
-            used_size = total_size - free_size
-            
-            if total_size > 0:
-                usage_percent = round((used_size / total_size) * 100, 1)
-                
-                # Convert bytes to appropriate units for display
-                def format_bytes(bytes_val):
-                    if bytes_val >= 1024**3:  # GB
-                        return f"{round(bytes_val / (1024**3), 2)} GB"
-                    elif bytes_val >= 1024**2:  # MB
-                        return f"{round(bytes_val / (1024**2), 1)} MB"
-                    elif bytes_val >= 1024:  # KB
-                        return f"{round(bytes_val / 1024, 1)} KB"
-                    else:
-                        return f"{bytes_val} B"
-                
-                used_formatted = format_bytes(used_size)
-                total_formatted = format_bytes(total_size)
-                
-                # Display format: "85.2% (1.2 GB / 1.4 GB)"
-                self._attr_native_value = f"{usage_percent}% ({used_formatted} / {total_formatted})"
-                
-                self._attr_extra_state_attributes = {
-                    "usage_percentage": usage_percent,
-                    "used_size_bytes": used_size,
-                    "total_size_bytes": total_size,
-                    "free_size_bytes": free_size,
-                    "used_formatted": used_formatted,
-                    "total_formatted": total_formatted,
-                    "free_formatted": format_bytes(free_size),
-                    "fs_ready": device_info.get("fs_ready", False),
-                    "storage_status": "healthy" if usage_percent < 90 else "warning" if usage_percent < 95 else "critical",
-                }
-            else:
-                self._attr_native_value = "Unknown"
-                self._attr_extra_state_attributes = {}
-        else:
+        if not device_info:
             self._attr_native_value = "Offline"
             self._attr_extra_state_attributes = {}
+            return
+
+        total_size = device_info.get("total_size", 0)
+        if total_size <= 0:
+            self._attr_native_value = "Unknown"
+            self._attr_extra_state_attributes = {}
+            return
+
+        free_size = device_info.get("free_size", 0)
+        used_size = total_size - free_size
+        usage_percent = round((used_size / total_size) * 100, 1)
+
+        used_formatted = _format_bytes(used_size)
+        total_formatted = _format_bytes(total_size)
+        # Nothing used yet (e.g. freshly provisioned): free equals total
+        free_formatted = total_formatted if free_size == total_size else _format_bytes(free_size)
+
+        # Display format: "85.2% (1.2 GB / 1.4 GB)"
+        self._attr_native_value = f"{usage_percent}% ({used_formatted} / {total_formatted})"
+
+        self._attr_extra_state_attributes = {
+            "usage_percentage": usage_percent,
+            "used_size_bytes": used_size,
+            "total_size_bytes": total_size,
+            "free_size_bytes": free_size,
+            "used_formatted": used_formatted,
+            "total_formatted": total_formatted,
+            "free_formatted": free_formatted,
+            "fs_ready": device_info.get("fs_ready", False),
+            "storage_status": "healthy" if usage_percent < 90 else "warning" if usage_percent < 95 else "critical",
+        }
 
 
 class EinkCurrentImageSensor(EinkBaseSensor):
@@ -227,7 +243,7 @@ class EinkCurrentImageSensor(EinkBaseSensor):
         
         if device_info and device_info.get("image"):
             image_path = device_info.get("image", "")
-            image_name = image_path.split("/")[-1] if "/" in image_path else image_path
+            image_name = image_path.rpartition("/")[2]
             self._attr_native_value = image_name
             self._attr_extra_state_attributes = {
                 "full_path": image_path,
@@ -259,18 +275,12 @@ class EinkLogSensor(EinkBaseSensor):
             latest_log = logs[-1]
             self._attr_native_value = latest_log["message"]
 
-            # Show recent 10 logs in attributes
-            recent_logs = logs[-10:] if len(logs) > 10 else logs
-            log_history = []
-            for log in recent_logs:
-                timestamp = log["timestamp"].strftime("%H:%M:%S")
-                log_history.append(f"[{timestamp}] {log['level'].upper()}: {log['message']}")
-
+            # Show recent 10 logs in attributes, formatted when they were added
             self._attr_extra_state_attributes = {
                 "latest_level": latest_log["level"],
                 "latest_timestamp": latest_log["timestamp"].isoformat(),
                 "total_logs": len(logs),
-                "recent_logs": log_history,
+                "recent_logs": list(runtime_data.recent_logs),
             }
         else:
             self._attr_native_value = "No logs"
@@ -349,20 +359,11 @@ class EinkScreenResolutionSensor(EinkBaseSensor):
             width = device_info.get("width", 0)
             height = device_info.get("height", 0)
 
-            # Determine canvas model based on resolution
-            canvas_model = "Unknown"
-            if width == 480 and height == 800:
-                canvas_model = "7.3\" Canvas"
-            elif width == 1200 and height == 1600:
-                canvas_model = "13.3\" Canvas"
-            elif width == 2160 and height == 3060:
-                canvas_model = "28.5\" Canvas"
-
             self._attr_native_value = f"{width}x{height}"
             self._attr_extra_state_attributes = {
                 "width": width,
                 "height": height,
-                "canvas_model": canvas_model,
+                "canvas_model": CANVAS_MODELS.get((width, height), "Unknown"),
                 "screen_model": device_info.get("screen_model", "Unknown"),
                 "aspect_ratio": f"{width}:{height}",
             }
@@ -39,6 +39,13 @@ class EinkDeviceNameText(TextEntity):
         self._config_entry = config_entry
         self._host = host
         self._device_name = device_name
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, host)},
+            name=device_name,
+            manufacturer="BLOOMIN8",
+            model="E-Ink Canvas",
+            # configuration_url=f"http://{host}",  # Disabled to prevent external access
+        )
         self._attr_has_entity_name = True
         self._attr_name = "Device Name"
         self._attr_unique_id = f"eink_display_{host}_device_name"
@@ -48,17 +55,6 @@ class EinkDeviceNameText(TextEntity):
         self._attr_native_max = 50
         self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._host)},
-            name=self._device_name,
-            manufacturer="BLOOMIN8",
-            model="E-Ink Canvas",
-            # configuration_url=f"http://{self._host}",  # Disabled to prevent external access
-        )
-
     def _get_device_info(self) -> dict | None:
         """Get device info from shared runtime data."""
         runtime_data = self._config_entry.runtime_data